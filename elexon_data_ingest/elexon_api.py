@@ -1,12 +1,34 @@
 """ Contains a class to retrieve data from the Elexon API """
+import hashlib
+import io
+import json
 import logging
-from abc import ABC, abstractmethod
-from typing import Any, Union
+import operator
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Union
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from requests.auth import HTTPBasicAuth
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.json as paj
+except ImportError:
+    paj = None
+
+# Payload size above which responses are parsed with pyarrow's parallel
+# JSON reader instead of orjson.
+_LARGE_PAYLOAD_BYTES = 1_000_000
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -15,157 +37,250 @@ file_handler.setLevel(logging.DEBUG)
 logger.addHandler(file_handler)
 
 
-class DataStrategy(ABC):
-    """
-    Abstract base class for data processing strategies.
+def _parse_temperature(data: dict) -> pd.DataFrame:
     """
+    Parses temperature data.
 
-    @abstractmethod
-    def process_data(self, data: dict) -> pd.DataFrame:
-        """
-        Processes the data according to the specific strategy.
+    Parameters:
+        - data (dict): The raw temperature data fetched from the API.
 
-        Parameters:
-            - data (dict): The raw data fetched from the API.
+    Returns:
+        - pd.DataFrame: The parsed temperature data.
+    """
+    get_fields = operator.itemgetter(
+        "temperature", "temperatureReferenceAverage", "measurementDate"
+    )
+    temperatures, reference_averages, dates = (
+        zip(*map(get_fields, data["data"]))
+        if data["data"]
+        else ((), (), ())
+    )
+
+    temperature_df: pd.DataFrame = pd.DataFrame(
+        {
+            "temperature": np.fromiter(
+                temperatures, dtype=np.float32, count=len(temperatures)
+            ),
+            "temperatureReferenceAverage": np.fromiter(
+                reference_averages,
+                dtype=np.float32,
+                count=len(reference_averages),
+            ),
+            "timestamp": pd.to_datetime(
+                list(dates), format="ISO8601", cache=True, utc=True
+            ).normalize(),
+        }
+    )
+    logger.info("Temperature data:\n%s\n", temperature_df)
 
-        Returns:
-            - dict: The processed data.
-        """
-        return data
+    return temperature_df
 
-    @abstractmethod
-    def get_strategy_info(self) -> str:
-        """
-        Abstract method to be implemented by subclasses.
 
-        Returns:
-            - str: Information about the strategy.
-        """
+def _parse_generation(data: dict) -> pd.DataFrame:
+    """
+    Parses generation data.
 
+    Parameters:
+        - data (dict): The raw generation data fetched from the API.
 
-class TemperatureStrategy(DataStrategy):
+    Returns:
+        - pd.DataFrame: The parsed generation data.
     """
-    Data processing strategy for temperature data.
+    get_entry = operator.itemgetter("startTime", "data")
+    get_subentry = operator.itemgetter("psrType", "quantity")
+
+    start_times, subentry_lists = (
+        zip(*map(get_entry, data["data"])) if data["data"] else ((), ())
+    )
+    counts = np.fromiter(
+        map(len, subentry_lists), dtype=np.intp, count=len(subentry_lists)
+    )
+    rows = list(map(get_subentry, chain.from_iterable(subentry_lists)))
+    psr_types, quantities = zip(*rows) if rows else ((), ())
+
+    generation_df: pd.DataFrame = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                list(start_times), format="ISO8601", cache=True, utc=True
+            ).repeat(counts),
+            "psrType": pd.Categorical(psr_types),
+            "quantity": np.asarray(quantities, dtype=np.float32),
+        }
+    )
+    logger.info("Generation data:\n%s\n", generation_df)
+
+    return generation_df
+
+
+def _parse_generation_table(table: Any) -> pd.DataFrame:
     """
+    Parses generation data from a pyarrow Table.
 
-    def process_data(self, data: dict) -> pd.DataFrame:
-        """
-        Processes temperature data.
+    Flattens the nested days x psrTypes structure on the Arrow side,
+    avoiding the Python-level loop over the payload entirely.
 
-        Parameters:
-            - data (dict): The raw temperature data fetched from the API.
+    Parameters:
+        - table (pyarrow.Table): The parsed response.
 
-        Returns:
-            - dict: The processed temperature data.
-        """
-        extracted_data: list[dict[str, Any]] = [
-            {
-                "temperature": entry["temperature"],
-                "temperatureReferenceAverage": entry[
-                    "temperatureReferenceAverage"
-                ],
-                "timestamp": pd.to_datetime(entry["measurementDate"]).date(),
-            }
-            for entry in data["data"]
-        ]
+    Returns:
+        - pd.DataFrame: The parsed generation data.
+    """
+    entries = table.column("data").combine_chunks().flatten()
+    subentry_lists = entries.field("data")
+    subentries = pc.list_flatten(subentry_lists)
+
+    start_times = pd.to_datetime(
+        entries.field("startTime").to_pylist(),
+        format="ISO8601",
+        cache=True,
+        utc=True,
+    )
+    counts = pc.list_value_length(subentry_lists).to_numpy()
+
+    generation_df: pd.DataFrame = pd.DataFrame(
+        {
+            "timestamp": start_times.repeat(counts),
+            "psrType": pd.Categorical(
+                subentries.field("psrType").to_pylist()
+            ),
+            "quantity": subentries.field("quantity")
+            .to_numpy(zero_copy_only=False)
+            .astype(np.float32),
+        }
+    )
+    logger.info("Generation data:\n%s\n", generation_df)
 
-        temperature_df: pd.DataFrame = pd.DataFrame(extracted_data)
-        logger.info("Temperature data:\n%s\n", temperature_df)
+    return generation_df
 
-        return temperature_df
 
-    def get_strategy_info(self) -> str:
-        """
-        Provides information about the temperature strategy.
+def _parse_demand(data: dict) -> pd.DataFrame:
+    """
+    Parses demand data.
 
-        Returns:
-            - str: Information about the temperature strategy.
-        """
-        return "TemperatureStrategy class"
+    Parameters:
+        - data (dict): The raw demand data fetched from the API.
+
+    Returns:
+        - pd.DataFrame: The parsed demand data.
+    """
+    demand_df: pd.DataFrame = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                list(map(operator.itemgetter("startTime"), data["data"])),
+                format="ISO8601",
+                cache=True,
+                utc=True,
+            ),
+            "initialDemandOutturn": np.asarray(
+                [
+                    entry.get("initialDemandOutturn")
+                    for entry in data["data"]
+                ],
+                dtype=np.float32,
+            ),
+        }
+    )
+    logger.info("Demand data:\n%s\n", demand_df)
 
+    return demand_df
 
-class GenerationStrategy(DataStrategy):
+
+def _parse_temperature_csv(content: bytes) -> pd.DataFrame:
     """
-    Data processing strategy for generation data.
+    Parses temperature data from a CSV response.
+
+    Parameters:
+        - content (bytes): The raw CSV response body.
 
-    Methods:
-        - process_data(data: dict) -> dict: Processes generation data.
+    Returns:
+        - pd.DataFrame: The parsed temperature data.
     """
+    raw = pd.read_csv(io.BytesIO(content), engine="pyarrow")
+    temperature_df: pd.DataFrame = pd.DataFrame(
+        {
+            "temperature": raw["temperature"].astype(np.float32),
+            "temperatureReferenceAverage": raw[
+                "temperatureReferenceAverage"
+            ].astype(np.float32),
+            "timestamp": pd.to_datetime(
+                raw["measurementDate"], format="ISO8601", cache=True, utc=True
+            ).dt.normalize(),
+        }
+    )
+    logger.info("Temperature data:\n%s\n", temperature_df)
 
-    def process_data(self, data: dict) -> pd.DataFrame:
-        """
-        Processes generation data.
+    return temperature_df
 
-        Parameters:
-            - data (dict): The raw generation data fetched from the API.
 
-        Returns:
-            - dict: The processed generation data.
-        """
-        extracted_data: list[dict[str, Any]] = [
-            {
-                "timestamp": pd.to_datetime(entry["startTime"]),
-                "psrType": subentry["psrType"],
-                "quantity": subentry["quantity"],
-            }
-            for entry in data["data"]
-            for subentry in entry["data"]
-        ]
-
-        generation_df: pd.DataFrame = pd.DataFrame(extracted_data)
-        logger.info("Generation data:\n%s\n", generation_df)
-
-        return generation_df
-
-    def get_strategy_info(self) -> str:
-        """
-        Provides information about the generation strategy.
+def _parse_generation_csv(content: bytes) -> pd.DataFrame:
+    """
+    Parses generation data from a CSV response.
 
-        Returns:
-            - str: Information about the generation strategy.
-        """
-        return "GenerationStrategy class"
+    The CSV format ships one row per psrType per settlement period, so
+    no nested-structure flattening is needed.
 
+    Parameters:
+        - content (bytes): The raw CSV response body.
 
-class DemandStrategy(DataStrategy):
+    Returns:
+        - pd.DataFrame: The parsed generation data.
     """
-    Data processing strategy for demand data.
+    raw = pd.read_csv(io.BytesIO(content), engine="pyarrow")
+    generation_df: pd.DataFrame = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                raw["startTime"], format="ISO8601", cache=True, utc=True
+            ),
+            "psrType": pd.Categorical(raw["psrType"]),
+            "quantity": raw["quantity"].astype(np.float32),
+        }
+    )
+    logger.info("Generation data:\n%s\n", generation_df)
+
+    return generation_df
 
-    Methods:
-        - process_data(data: dict) -> dict: Processes demand data.
+
+def _parse_demand_csv(content: bytes) -> pd.DataFrame:
     """
+    Parses demand data from a CSV response.
 
-    def process_data(self, data: dict) -> pd.DataFrame:
-        """
-        Processes demand data.
+    Parameters:
+        - content (bytes): The raw CSV response body.
 
-        Parameters:
-            - data (dict): The raw demand data fetched from the API.
+    Returns:
+        - pd.DataFrame: The parsed demand data.
+    """
+    raw = pd.read_csv(io.BytesIO(content), engine="pyarrow")
+    demand_df: pd.DataFrame = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                raw["startTime"], format="ISO8601", cache=True, utc=True
+            ),
+            "initialDemandOutturn": raw["initialDemandOutturn"].astype(
+                np.float32
+            ),
+        }
+    )
+    logger.info("Demand data:\n%s\n", demand_df)
 
-        Returns:
-            - dict: The processed demand data.
-        """
-        extracted_data: list[dict[str, Any]] = [
-            {
-                "timestamp": pd.to_datetime(entry["startTime"]),
-                "initialDemandOutturn": entry.get("initialDemandOutturn"),
-            }
-            for entry in data["data"]
-        ]
+    return demand_df
 
-        demand_df: pd.DataFrame = pd.DataFrame(extracted_data)
-        logger.info("Demand data:\n%s\n", demand_df)
 
-        return demand_df
+_PARSERS: dict[str, Callable[[dict], pd.DataFrame]] = {
+    "temperature": _parse_temperature,
+    "generation/actual/per-type": _parse_generation,
+    "demand/outturn": _parse_demand,
+}
 
-    def get_strategy_info(self) -> str:
-        """
-        Provides information about the demand strategy.
+_TABLE_PARSERS: dict[str, Callable[[Any], pd.DataFrame]] = {
+    "generation/actual/per-type": _parse_generation_table,
+}
 
-        Returns:
-            - str: Information about the demand strategy.
-        """
-        return "DemandStrategy class"
+_CSV_PARSERS: dict[str, Callable[[bytes], pd.DataFrame]] = {
+    "temperature": _parse_temperature_csv,
+    "generation/actual/per-type": _parse_generation_csv,
+    "demand/outturn": _parse_demand_csv,
+}
 
 
 class ElexonAPI:
@@ -178,64 +293,128 @@ class ElexonAPI:
         auth: str,
         start_date: str,
         end_date: str,
-        data_format: str = "json",
+        data_format: str = "csv",
+        cache_dir: Union[str, Path, None] = None,
     ):
         self.base_url = "https://data.elexon.co.uk/bmrs/api/v1/"
         self.auth = HTTPBasicAuth("apikey", auth)
         self.start_date = start_date
         self.end_date = end_date
         self.format = data_format
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
-    def fetch_data(
-        self, endpoint: str, strategy: DataStrategy
-    ) -> Union[pd.DataFrame, None]:
+        # The URLs and query params never change for an instance, so
+        # build them once rather than on every fetch.
+        self._endpoints: dict[str, str] = {
+            endpoint: self.base_url + endpoint for endpoint in _PARSERS
+        }
+        self._params: dict[str, str] = {
+            "from": start_date,
+            "to": end_date,
+            "format": data_format,
+        }
+        self._demand_params: dict[str, str] = {
+            "settlementDateFrom": start_date,
+            "settlementDateTo": end_date,
+            "format": data_format,
+        }
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.auth = self.auth
+
+    def __enter__(self) -> "ElexonAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._session.close()
+
+    def fetch_data(self, endpoint: str) -> pd.DataFrame:
         """
         Fetches data from the specified endpoint for the date range and format.
 
         Parameters:
             - endpoint (str): The specific API endpoint to fetch data from.
-            - strategy (DataStrategy): The strategy for processing the data.
 
         Returns:
-            - Union[pd.DataFrame, None]: If successful, returns the processed data as a DataFrame.
-                                        If unsuccessful, returns None.
+            - pd.DataFrame: The processed data.
+
+        Raises:
+            - requests.exceptions.RequestException: If the request fails
+              after the session's retries are exhausted.
         """
-        url_params: dict[str, str] = {
-            "from": self.start_date,
-            "to": self.end_date,
-            "format": self.format,
-        }
+        cache_path: Union[Path, None] = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / f"{self._cache_key(endpoint)}.parquet"
+            if cache_path.exists():
+                logger.info(
+                    "Reading cached %s data from %s", endpoint, cache_path
+                )
+                return pd.read_parquet(cache_path)
+
+        url_params: dict[str, str] = (
+            self._demand_params
+            if endpoint == "demand/outturn"
+            else self._params
+        )
 
-        if endpoint == "demand/outturn":
-            url_params["settlementDateFrom"] = url_params.pop("from")
-            url_params["settlementDateTo"] = url_params.pop("to")
-
-        try:
-            response: requests.Response = requests.get(
-                f"{self.base_url}{endpoint}",
-                params=url_params,
-                timeout=5,
-                auth=self.auth,
-            )
-            response.raise_for_status()
-            data: Any = response.json()
-            processed_data: pd.DataFrame = strategy.process_data(data)
-
-            return processed_data
-        except requests.exceptions.RequestException as e:
-            logger.info("Error fetching data: %s", e)
-            return None
-
-    def get_temperature_data(self) -> Union[pd.DataFrame, None]:
+        response: requests.Response = self._session.get(
+            self._endpoints.get(endpoint, f"{self.base_url}{endpoint}"),
+            params=url_params,
+            stream=True,
+            timeout=5,
+        )
+        response.raise_for_status()
+        # Read the raw bytes directly; the parsers all take bytes, so
+        # there is no need for requests' charset detection and str
+        # decode of the whole body.
+        content: bytes = response.raw.read(decode_content=True)
+        table_parser = _TABLE_PARSERS.get(endpoint)
+        if self.format == "csv":
+            processed_data: pd.DataFrame = _CSV_PARSERS[endpoint](content)
+        elif (
+            paj is not None
+            and table_parser is not None
+            and len(content) >= _LARGE_PAYLOAD_BYTES
+        ):
+            table = paj.read_json(io.BytesIO(content))
+            processed_data = table_parser(table)
+        else:
+            if orjson is not None:
+                data: Any = orjson.loads(content)
+            else:
+                data = json.loads(content)
+            processed_data = _PARSERS[endpoint](data)
+
+        if cache_path is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            processed_data.to_parquet(cache_path, compression="zstd")
+
+        return processed_data
+
+    def _cache_key(self, endpoint: str) -> str:
+        """Builds a stable cache key for an endpoint, date range and format."""
+        return hashlib.blake2b(
+            f"{endpoint}|{self.start_date}|{self.end_date}|{self.format}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def get_temperature_data(self) -> pd.DataFrame:
         """Fetches temperature data."""
-        return self.fetch_data("temperature", TemperatureStrategy())
+        return self.fetch_data("temperature")
 
-    def get_generation_data(self) -> Union[pd.DataFrame, None]:
+    def get_generation_data(self) -> pd.DataFrame:
         """Fetches generation data."""
-        return self.fetch_data(
-            "generation/actual/per-type", GenerationStrategy()
-        )
+        return self.fetch_data("generation/actual/per-type")
 
-    def get_demand_data(self) -> Union[pd.DataFrame, None]:
+    def get_demand_data(self) -> pd.DataFrame:
         """Fetches demand data."""
-        return self.fetch_data("demand/outturn", DemandStrategy())
+        return self.fetch_data("demand/outturn")
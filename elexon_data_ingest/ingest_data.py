@@ -1,8 +1,10 @@
 """ Ingests data from the Elexon API """
 
 import argparse
+import concurrent.futures
 
 import pandas as pd
+import requests
 from sqlalchemy import create_engine, text
 
 from elexon_data_ingest.elexon_api import ElexonAPI, logger
@@ -40,36 +42,66 @@ def ingest_elexon_data() -> None:
 
     args = parser.parse_args()
 
-    elexon_api: ElexonAPI = ElexonAPI(
+    results: dict[str, pd.DataFrame] = {}
+    with ElexonAPI(
         auth=args.api_key, start_date=args.from_date, end_date=args.to_date
+    ) as elexon_api:
+        fetchers = {
+            "temperature": elexon_api.get_temperature_data,
+            "generation": elexon_api.get_generation_data,
+            "demand": elexon_api.get_demand_data,
+        }
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                name: executor.submit(fetch)
+                for name, fetch in fetchers.items()
+            }
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except requests.exceptions.RequestException as error:
+                    # Retry only the failed endpoint; the other two
+                    # results are already in hand.
+                    logger.info(
+                        "Retrying %s fetch after error: %s", name, error
+                    )
+                    results[name] = executor.submit(fetchers[name]).result()
+
+    temperature_data: pd.DataFrame = results["temperature"]
+    generation_data: pd.DataFrame = results["generation"]
+    demand_data: pd.DataFrame = results["demand"]
+
+    generation_data = generation_data.set_index("timestamp").sort_index()
+    temperature_data = temperature_data.set_index("timestamp").sort_index()
+    demand_data = demand_data.set_index("timestamp").sort_index()
+
+    # Align temperature and demand onto the generation timestamp grid so
+    # the concat is a straight copy of column blocks over one shared
+    # index rather than two hash joins.
+    temperature_aligned: pd.DataFrame = temperature_data.reindex(
+        generation_data.index, method="ffill", tolerance=pd.Timedelta("1D")
     )
+    demand_aligned: pd.DataFrame = demand_data.reindex(generation_data.index)
 
-    temperature_data: pd.DataFrame = elexon_api.get_temperature_data()
-    generation_data: pd.DataFrame = elexon_api.get_generation_data()
-    demand_data: pd.DataFrame = elexon_api.get_demand_data()
-
-    merged_data: pd.DataFrame = (
-        pd.merge(
-            generation_data,
-            temperature_data,
-            left_on=pd.to_datetime(generation_data["timestamp"]).dt.date,
-            right_on="timestamp",
-            how="left",
-        )
-        .drop(["timestamp", "timestamp_y"], axis=1)
-        .rename(columns={"timestamp_x": "timestamp"})
-    )
-
-    merged_data: pd.DataFrame = pd.merge(
-        merged_data, demand_data, on="timestamp", how="outer"
+    # Drop rows missing any reading, matching what the original
+    # outer-merge-plus-dropna persisted.
+    merged_data: pd.DataFrame = pd.concat(
+        [generation_data, temperature_aligned, demand_aligned], axis=1
     ).dropna()
-    merged_data.set_index("timestamp", inplace=True)
 
     logger.info("Consolidated data:\n%s\n", merged_data)
 
     engine = create_engine("sqlite://", echo=False)
 
-    merged_data.to_sql("elexon", con=engine)
+    merged_data.to_sql(
+        "elexon",
+        con=engine,
+        if_exists="replace",
+        index=True,
+        method="multi",
+        chunksize=1000,
+    )
 
     with engine.connect() as conn:
         logger.info(
@@ -1,11 +1,16 @@
+import json
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from elexon_data_ingest.elexon_api import (
-    DemandStrategy,
     ElexonAPI,
-    GenerationStrategy,
-    TemperatureStrategy,
+    _parse_demand,
+    _parse_demand_csv,
+    _parse_generation,
+    _parse_generation_csv,
+    _parse_temperature,
+    _parse_temperature_csv,
 )
 
 
@@ -23,32 +28,124 @@ class TestElexonAPI(unittest.TestCase):
         self.end_date = "2023-01-31"
         self.elexon_api = ElexonAPI(self.api_key, self.start_date, self.end_date)
 
-    @patch("elexon_data_ingest.elexon_api.requests.get")
+    @staticmethod
+    def _mock_response(content):
+        """Builds a mock response carrying the given body."""
+        mock_response = MagicMock()
+        mock_response.raw.read.return_value = content
+        return mock_response
+
+    @patch("elexon_data_ingest.elexon_api.requests.Session.get")
     def test_fetch_data(self, mock_get):
         """
         Test the fetch_data method of the ElexonAPI class.
         """
-        # Mock the response from the API
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"data": []}
-        mock_get.return_value = mock_response
+        # Mock the CSV responses from the API, one per endpoint
+        mock_get.side_effect = [
+            self._mock_response(
+                b"temperature,temperatureReferenceAverage,measurementDate\n"
+                b"20,18,2023-01-01\n"
+            ),
+            self._mock_response(
+                b"startTime,psrType,quantity\n2023-01-01T00:00:00,CCGT,100\n"
+            ),
+            self._mock_response(
+                b"startTime,initialDemandOutturn\n2023-01-01T00:00:00,5000\n"
+            ),
+        ]
 
         # Test fetching temperature data
-        temperature_data = self.elexon_api.fetch_data(
-            "temperature", TemperatureStrategy()
-        )
+        temperature_data = self.elexon_api.fetch_data("temperature")
         self.assertIsInstance(temperature_data, pd.DataFrame)
 
         # Test fetching generation data
-        generation_data = self.elexon_api.fetch_data(
-            "generation/actual/per-type", GenerationStrategy()
-        )
+        generation_data = self.elexon_api.fetch_data("generation/actual/per-type")
         self.assertIsInstance(generation_data, pd.DataFrame)
 
         # Test fetching demand data
-        demand_data = self.elexon_api.fetch_data("demand/outturn", DemandStrategy())
+        demand_data = self.elexon_api.fetch_data("demand/outturn")
         self.assertIsInstance(demand_data, pd.DataFrame)
 
+    @patch("elexon_data_ingest.elexon_api.requests.Session.get")
+    def test_fetch_data_json_format(self, mock_get):
+        """
+        Test fetch_data with the JSON fallback format.
+        """
+        mock_get.return_value = self._mock_response(b'{"data": []}')
+
+        elexon_api = ElexonAPI(
+            self.api_key,
+            self.start_date,
+            self.end_date,
+            data_format="json",
+        )
+        temperature_data = elexon_api.fetch_data("temperature")
+        self.assertIsInstance(temperature_data, pd.DataFrame)
+
+    @patch("elexon_data_ingest.elexon_api._LARGE_PAYLOAD_BYTES", 1)
+    @patch("elexon_data_ingest.elexon_api.requests.Session.get")
+    def test_fetch_data_large_payload_arrow_path(self, mock_get):
+        """
+        Test that the pyarrow large-payload branch matches the orjson
+        parser's output.
+        """
+        payload = {
+            "data": [
+                {
+                    "startTime": "2023-01-01T00:00:00Z",
+                    "data": [
+                        {"psrType": "CCGT", "quantity": 100.5},
+                        {"psrType": "WIND", "quantity": 50.0},
+                    ],
+                },
+                {
+                    "startTime": "2023-01-01T00:30:00Z",
+                    "data": [{"psrType": "CCGT", "quantity": 90.0}],
+                },
+            ]
+        }
+        mock_get.return_value = self._mock_response(
+            json.dumps(payload).encode()
+        )
+
+        elexon_api = ElexonAPI(
+            self.api_key,
+            self.start_date,
+            self.end_date,
+            data_format="json",
+        )
+        arrow_data = elexon_api.fetch_data("generation/actual/per-type")
+
+        pd.testing.assert_frame_equal(
+            arrow_data.reset_index(drop=True),
+            _parse_generation(payload).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    @patch("elexon_data_ingest.elexon_api.requests.Session.get")
+    def test_fetch_data_uses_parquet_cache(self, mock_get):
+        """
+        Test that fetch_data caches results and skips the network on re-runs.
+        """
+        mock_get.return_value = self._mock_response(
+            b"temperature,temperatureReferenceAverage,measurementDate\n"
+            b"20,18,2023-01-01\n"
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            elexon_api = ElexonAPI(
+                self.api_key,
+                self.start_date,
+                self.end_date,
+                cache_dir=cache_dir,
+            )
+            first = elexon_api.fetch_data("temperature")
+            second = elexon_api.fetch_data("temperature")
+
+        self.assertEqual(mock_get.call_count, 1)
+        # Parquet may round-trip timestamps at a different resolution
+        pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
     @patch.object(ElexonAPI, "fetch_data")
     def test_get_temperature_data(self, mock_fetch_data):
         """
@@ -57,10 +154,7 @@ class TestElexonAPI(unittest.TestCase):
         mock_fetch_data.return_value = pd.DataFrame()
         temperature_data = self.elexon_api.get_temperature_data()
         self.assertIsInstance(temperature_data, pd.DataFrame)
-        mock_fetch_data.assert_called_once()
-        args, _ = mock_fetch_data.call_args
-        self.assertEqual(args[0], "temperature")
-        self.assertIsInstance(args[1], TemperatureStrategy)
+        mock_fetch_data.assert_called_once_with("temperature")
 
     @patch.object(ElexonAPI, "fetch_data")
     def test_get_generation_data(self, mock_fetch_data):
@@ -70,10 +164,7 @@ class TestElexonAPI(unittest.TestCase):
         mock_fetch_data.return_value = pd.DataFrame()
         generation_data = self.elexon_api.get_generation_data()
         self.assertIsInstance(generation_data, pd.DataFrame)
-        mock_fetch_data.assert_called_once()
-        args, _ = mock_fetch_data.call_args
-        self.assertEqual(args[0], "generation/actual/per-type")
-        self.assertIsInstance(args[1], GenerationStrategy)
+        mock_fetch_data.assert_called_once_with("generation/actual/per-type")
 
     @patch.object(ElexonAPI, "fetch_data")
     def test_get_demand_data(self, mock_fetch_data):
@@ -83,20 +174,17 @@ class TestElexonAPI(unittest.TestCase):
         mock_fetch_data.return_value = pd.DataFrame()
         demand_data = self.elexon_api.get_demand_data()
         self.assertIsInstance(demand_data, pd.DataFrame)
-        mock_fetch_data.assert_called_once()
-        args, _ = mock_fetch_data.call_args
-        self.assertEqual(args[0], "demand/outturn")
-        self.assertIsInstance(args[1], DemandStrategy)
+        mock_fetch_data.assert_called_once_with("demand/outturn")
 
 
-class TestDataStrategies(unittest.TestCase):
+class TestParsers(unittest.TestCase):
     """
-    Test case for the data processing strategies.
+    Test case for the endpoint parser functions.
     """
 
-    def test_temperature_strategy(self):
+    def test_parse_temperature(self):
         """
-        Test the process_data method of the TemperatureStrategy class.
+        Test the _parse_temperature function.
         """
         data = {
             "data": [
@@ -107,13 +195,13 @@ class TestDataStrategies(unittest.TestCase):
                 }
             ]
         }
-        temperature_data = TemperatureStrategy().process_data(data)
+        temperature_data = _parse_temperature(data)
         self.assertIsInstance(temperature_data, pd.DataFrame)
         self.assertEqual(len(temperature_data), 1)
 
-    def test_generation_strategy(self):
+    def test_parse_generation(self):
         """
-        Test the process_data method of the GenerationStrategy class.
+        Test the _parse_generation function.
         """
         data = {
             "data": [
@@ -123,13 +211,13 @@ class TestDataStrategies(unittest.TestCase):
                 }
             ]
         }
-        generation_data = GenerationStrategy().process_data(data)
+        generation_data = _parse_generation(data)
         self.assertIsInstance(generation_data, pd.DataFrame)
         self.assertEqual(len(generation_data), 1)
 
-    def test_demand_strategy(self):
+    def test_parse_demand(self):
         """
-        Test the process_data method of the DemandStrategy class.
+        Test the _parse_demand function.
         """
         data = {
             "data": [
@@ -139,10 +227,82 @@ class TestDataStrategies(unittest.TestCase):
                 }
             ]
         }
-        demand_data = DemandStrategy().process_data(data)
+        demand_data = _parse_demand(data)
         self.assertIsInstance(demand_data, pd.DataFrame)
         self.assertEqual(len(demand_data), 1)
 
+    def test_csv_parsers_timestamps_are_utc(self):
+        """
+        Test that the CSV parsers produce tz-aware UTC timestamps.
+        """
+        temperature_data = _parse_temperature_csv(
+            b"temperature,temperatureReferenceAverage,measurementDate\n"
+            b"20,18,2023-01-01\n"
+        )
+        generation_data = _parse_generation_csv(
+            b"startTime,psrType,quantity\n2023-01-01T00:00:00Z,CCGT,100\n"
+        )
+        demand_data = _parse_demand_csv(
+            b"startTime,initialDemandOutturn\n2023-01-01T00:00:00Z,5000\n"
+        )
+        for frame in (temperature_data, generation_data, demand_data):
+            self.assertEqual(str(frame["timestamp"].dt.tz), "UTC")
+
+    def test_merge_path_with_mixed_timestamp_forms(self):
+        """
+        Test the ingest merge path with Z-suffixed startTimes and bare
+        measurementDates, as the BMRS API actually returns them.
+        """
+        generation_data = _parse_generation(
+            {
+                "data": [
+                    {
+                        "startTime": "2023-01-01T00:00:00Z",
+                        "data": [
+                            {"psrType": "CCGT", "quantity": 100},
+                            {"psrType": "WIND", "quantity": 50},
+                        ],
+                    }
+                ]
+            }
+        )
+        temperature_data = _parse_temperature(
+            {
+                "data": [
+                    {
+                        "temperature": 20,
+                        "temperatureReferenceAverage": 18,
+                        "measurementDate": "2023-01-01",
+                    }
+                ]
+            }
+        )
+        demand_data = _parse_demand(
+            {
+                "data": [
+                    {
+                        "startTime": "2023-01-01T00:00:00Z",
+                        "initialDemandOutturn": 5000,
+                    }
+                ]
+            }
+        )
+
+        generation_data = generation_data.set_index("timestamp").sort_index()
+        temperature_data = temperature_data.set_index("timestamp").sort_index()
+        demand_data = demand_data.set_index("timestamp").sort_index()
+
+        temperature_aligned = temperature_data.reindex(
+            generation_data.index, method="ffill", tolerance=pd.Timedelta("1D")
+        )
+        demand_aligned = demand_data.reindex(generation_data.index)
+        merged_data = pd.concat(
+            [generation_data, temperature_aligned, demand_aligned], axis=1
+        ).dropna()
+
+        self.assertEqual(len(merged_data), 2)
+        self.assertFalse(merged_data["temperature"].isna().any())
+
 
 if __name__ == "__main__":
     unittest.main()